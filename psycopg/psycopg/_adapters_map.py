@@ -61,6 +61,12 @@ class AdaptersMap:
 
     _dumpers: Dict[PyFormat, Dict[Union[type, str], Type[Dumper]]]
     _dumpers_by_oid: List[Dict[int, Type[Dumper]]]
+    # Flat cache of the dumpers returned by get_dumper(), including the ones
+    # found on a superclass, so that a lookup is a single dict probe. It is
+    # shared with the maps created from this one until either is customised,
+    # and holds at most _dumpers_found_maxsize classes per format.
+    _dumpers_found: Dict[PyFormat, Dict[type, Type[Dumper]]]
+    _dumpers_found_maxsize = 1024
     _loaders: List[Dict[int, Type[Loader]]]
 
     # Record if a dumper or loader has an optimised version.
@@ -76,6 +82,10 @@ class AdaptersMap:
             self._own_dumpers = _dumpers_shared.copy()
             template._own_dumpers = _dumpers_shared.copy()
 
+            # The dumpers found are still valid until either map is
+            # customised: share them with the template.
+            self._dumpers_found = template._dumpers_found
+
             self._dumpers_by_oid = template._dumpers_by_oid[:]
             self._own_dumpers_by_oid = [False, False]
             template._own_dumpers_by_oid = [False, False]
@@ -89,6 +99,7 @@ class AdaptersMap:
         else:
             self._dumpers = {fmt: {} for fmt in PyFormat}
             self._own_dumpers = _dumpers_owned.copy()
+            self._dumpers_found = {fmt: {} for fmt in PyFormat}
 
             self._dumpers_by_oid = [{}, {}]
             self._own_dumpers_by_oid = [True, True]
@@ -140,6 +151,10 @@ class AdaptersMap:
         if _psycopg:
             dumper = self._get_optimised(dumper)
 
+        # The superclasses lookup might have a different result now. Don't
+        # clear the cache: it might be shared with other maps.
+        self._dumpers_found = {fmt: {} for fmt in PyFormat}
+
         # Register the dumper both as its format and as auto
         # so that the last dumper registered is used in auto (%s) format
         if cls:
@@ -196,33 +211,42 @@ class AdaptersMap:
         :param format: The format to dump to. If `~psycopg.adapt.PyFormat.AUTO`,
             use the last one of the dumpers registered on `!cls`.
         """
+        # Fast path: the class was already looked up, either directly or
+        # through its superclasses.
         try:
-            # Fast path: the class has a known dumper.
-            return self._dumpers[format][cls]
+            return self._dumpers_found[format][cls]
         except KeyError:
             if format not in self._dumpers:
                 raise ValueError(f"bad dumper format: {format}")
 
-            # If the KeyError was caused by cls missing from dmap, let's
-            # look for different cases.
+            # First time we see this class: look for its dumper and cache it.
+            found = self._dumpers_found[format]
             dmap = self._dumpers[format]
 
         # Look for the right class, including looking at superclasses
         for scls in cls.__mro__:
             if scls in dmap:
-                return dmap[scls]
+                d = dmap[scls]
+                break
 
             # If the adapter is not found, look for its name as a string
             fqn = scls.__module__ + "." + scls.__qualname__
             if fqn in dmap:
                 # Replace the class name with the class itself
                 d = dmap[scls] = dmap.pop(fqn)
-                return d
+                break
+        else:
+            raise e.ProgrammingError(
+                f"cannot adapt type {cls.__name__!r} using placeholder '%{format}'"
+                f" (format: {PyFormat(format).name})"
+            )
 
-        raise e.ProgrammingError(
-            f"cannot adapt type {cls.__name__!r} using placeholder '%{format}'"
-            f" (format: {PyFormat(format).name})"
-        )
+        # The cache keeps the classes alive: start over if it grows too much,
+        # which may happen if classes are created dynamically.
+        if len(found) >= self._dumpers_found_maxsize:
+            found.clear()
+        found[cls] = d
+        return d
 
     def get_dumper_by_oid(self, oid: int, format: pq.Format) -> Type["Dumper"]:
         """
@@ -9,7 +9,7 @@ dependencies problems).
 
 # Copyright (C) 2020 The Psycopg Team
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from typing import DefaultDict, TYPE_CHECKING
 from collections import defaultdict
 from typing_extensions import TypeAlias
@@ -20,6 +20,7 @@ from . import errors as e
 from .abc import Buffer, LoadFunc, AdaptContext, PyFormat, DumperKey, NoneType
 from .rows import Row, RowMaker
 from ._oids import INVALID_OID, TEXT_OID
+from ._compat import cache
 from ._encodings import pgconn_encoding
 
 if TYPE_CHECKING:
@@ -30,6 +31,8 @@ if TYPE_CHECKING:
 DumperCache: TypeAlias = Dict[DumperKey, abc.Dumper]
 OidDumperCache: TypeAlias = Dict[int, abc.Dumper]
 LoaderCache: TypeAlias = Dict[int, abc.Loader]
+GetValueFunc: TypeAlias = Callable[[int, int], Optional[bytes]]
+LoadRowFunc: TypeAlias = Callable[[GetValueFunc, int, List[LoadFunc]], Tuple[Any, ...]]
 
 TEXT = pq.Format.TEXT
 PY_TEXT = PyFormat.TEXT
@@ -51,7 +54,8 @@ class Transformer(AdaptContext):
     __slots__ = """
         types formats
         _conn _adapters _pgresult _dumpers _loaders _encoding _none_oid
-        _oid_dumpers _oid_types _row_dumpers _row_loaders
+        _oid_dumpers _oid_types _row_dumpers _row_loaders _row_loaders_key
+        _load_row _nfields _ntuples
         """.split()
 
     types: Optional[Tuple[int, ...]]
@@ -92,6 +96,9 @@ class Transformer(AdaptContext):
         # the length of the result columns
         self._row_loaders: List[LoadFunc] = []
 
+        # the format and the oids the row loaders were created for
+        self._row_loaders_key: Optional[Tuple[pq.Format, List[int]]] = None
+
         # mapping oid -> type sql representation
         self._oid_types: Dict[int, bytes] = {}
 
@@ -141,23 +148,32 @@ class Transformer(AdaptContext):
             self._nfields = self._ntuples = 0
             if set_loaders:
                 self._row_loaders = []
+                self._row_loaders_key = None
             return
 
         self._ntuples = result.ntuples
         nf = self._nfields = result.nfields
+        self._load_row = _make_load_row(nf)
 
         if not set_loaders:
             return
 
         if not nf:
             self._row_loaders = []
+            self._row_loaders_key = None
             return
 
         fmt: pq.Format
         fmt = result.fformat(0) if format is None else format  # type: ignore
-        self._row_loaders = [
-            self.get_loader(result.ftype(i), fmt).load for i in range(nf)
-        ]
+        key = (fmt, [result.ftype(i) for i in range(nf)])
+
+        # Reuse the loaders of the previous result if it has the same shape,
+        # for instance on executemany() with returning or on repeated queries.
+        if key == self._row_loaders_key:
+            return
+
+        self._row_loaders = [self.get_loader(oid, fmt).load for oid in key[1]]
+        self._row_loaders_key = key
 
     def set_dumper_types(self, types: Sequence[int], format: pq.Format) -> None:
         self._row_dumpers = [self.get_dumper_by_oid(oid, format) for oid in types]
@@ -166,6 +182,7 @@ class Transformer(AdaptContext):
 
     def set_loader_types(self, types: Sequence[int], format: pq.Format) -> None:
         self._row_loaders = [self.get_loader(oid, format).load for oid in types]
+        self._row_loaders_key = None
 
     def dump_sequence(
         self, params: Sequence[Any], formats: Sequence[PyFormat]
@@ -176,21 +193,23 @@ class Transformer(AdaptContext):
         # If we have dumpers, it means set_dumper_types had been called, in
         # which case self.types and self.formats are set to sequences of the
         # right size.
-        if self._row_dumpers:
+        dumpers = self._row_dumpers
+        if dumpers:
             for i in range(nparams):
                 param = params[i]
                 if param is not None:
-                    out[i] = self._row_dumpers[i].dump(param)
+                    out[i] = dumpers[i].dump(param)
             return out
 
         types = [self._get_none_oid()] * nparams
         pqformats = [TEXT] * nparams
 
+        get_dumper = self.get_dumper
         for i in range(nparams):
             param = params[i]
             if param is None:
                 continue
-            dumper = self.get_dumper(param, formats[i])
+            dumper = get_dumper(param, formats[i])
             out[i] = dumper.dump(param)
             types[i] = dumper.oid
             pqformats[i] = dumper.format
@@ -302,16 +321,40 @@ class Transformer(AdaptContext):
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
-        records = []
-        for row in range(row0, row1):
-            record: List[Any] = [None] * self._nfields
-            for col in range(self._nfields):
-                val = res.get_value(row, col)
+        nfields = self._nfields
+        if not nfields:
+            return [make_row(()) for _ in range(row0, row1)]
+
+        get_value = res.get_value
+        loaders = self._row_loaders
+
+        # Fast path for single-column results: build the 1-tuples directly.
+        if nfields == 1:
+            load = loaders[0]
+            values = [get_value(row, 0) for row in range(row0, row1)]
+            records = [(load(v) if v is not None else None,) for v in values]
+            if make_row is tuple:  # type: ignore[comparison-overlap]
+                return records  # type: ignore[return-value]
+            else:
+                return list(map(make_row, records))
+
+        # Process one column at a time, so that the loader is looked up once
+        columns: List[List[Any]] = []
+        for col in range(nfields):
+            load = loaders[col]
+            column = [None] * (row1 - row0)
+            for i, row in enumerate(range(row0, row1)):
+                val = get_value(row, col)
                 if val is not None:
-                    record[col] = self._row_loaders[col](val)
-            records.append(make_row(record))
+                    column[i] = load(val)
+            columns.append(column)
 
-        return records
+        # zip() already creates tuples, which is the output of the default
+        # row factory.
+        if make_row is tuple:  # type: ignore[comparison-overlap]
+            return list(zip(*columns))
+        else:
+            return list(map(make_row, zip(*columns)))
 
     def load_row(self, row: int, make_row: RowMaker[Row]) -> Optional[Row]:
         res = self._pgresult
@@ -321,12 +364,7 @@ class Transformer(AdaptContext):
         if not 0 <= row < self._ntuples:
             return None
 
-        record: List[Any] = [None] * self._nfields
-        for col in range(self._nfields):
-            val = res.get_value(row, col)
-            if val is not None:
-                record[col] = self._row_loaders[col](val)
-
+        record = self._load_row(res.get_value, row, self._row_loaders)
         return make_row(record)
 
     def load_sequence(self, record: Sequence[Optional[Buffer]]) -> Tuple[Any, ...]:
@@ -337,8 +375,10 @@ class Transformer(AdaptContext):
             )
 
         return tuple(
-            (self._row_loaders[i](val) if val is not None else None)
-            for i, val in enumerate(record)
+            [
+                (load(val) if val is not None else None)
+                for load, val in zip(self._row_loaders, record)
+            ]
         )
 
     def get_loader(self, oid: int, format: pq.Format) -> abc.Loader:
@@ -354,3 +394,28 @@ class Transformer(AdaptContext):
                 raise e.InterfaceError("unknown oid loader not found")
         loader = self._loaders[format][oid] = loader_cls(oid, self)
         return loader
+
+
+@cache
+def _make_load_row(nfields: int) -> LoadRowFunc:
+    """
+    Return a function loading a record of `!nfields` values.
+
+    The function returned takes the `!PGresult.get_value` method, the row
+    number and the row loaders. Its code has no loop on the columns: this is
+    noticeably faster than a generic loop on records with a few columns.
+    """
+    lines = ["def load_row(get_value, row, loaders):"]
+    if nfields:
+        lines.append(f"    {''.join(f'l{i}, ' for i in range(nfields))}= loaders")
+    for i in range(nfields):
+        lines.append(f"    v{i} = get_value(row, {i})")
+    items = "".join(
+        f"l{i}(v{i}) if v{i} is not None else None, " for i in range(nfields)
+    )
+    lines.append(f"    return ({items})")
+
+    ns: Dict[str, Any] = {}
+    exec("\n".join(lines), ns)
+    rv: LoadRowFunc = ns["load_row"]
+    return rv
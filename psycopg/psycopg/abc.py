@@ -76,6 +76,11 @@ class AdaptContext(Protocol):
 
     """
 
+    # Allow slotted implementations, such as the Python Transformer, not to
+    # have a __dict__. Hidden from mypy, which would make it a protocol member.
+    if not TYPE_CHECKING:
+        __slots__ = ()
+
     @property
     def adapters(self) -> "AdaptersMap":
         """The adapters configuration that this object uses."""
@@ -818,7 +818,9 @@ class PGresult:
         length: int = impl.PQgetlength(self._pgresult_ptr, row_number, column_number)
         if length:
             v = impl.PQgetvalue(self._pgresult_ptr, row_number, column_number)
-            return string_at(v, length)
+            # Slicing the char pointer copies the data into a bytes, much
+            # faster than going through ctypes.string_at().
+            return v[:length]  # type: ignore[return-value]
         else:
             if impl.PQgetisnull(self._pgresult_ptr, row_number, column_number):
                 return None
@@ -47,7 +47,7 @@ class BaseListDumper(RecursiveDumper):
         """
         Find the first non-null element of an eventually nested list
         """
-        items = list(self._flatiter(L, set()))
+        items = list(self._flatiter(L))
         types = {type(item): item for item in items}
         if not types:
             return None
@@ -81,14 +81,16 @@ class BaseListDumper(RecursiveDumper):
         else:
             return max(imax, -imin - 1)
 
-    def _flatiter(self, L: List[Any], seen: Set[int]) -> Any:
-        if id(L) in seen:
-            raise e.DataError("cannot dump a recursive list")
-
-        seen.add(id(L))
-
+    def _flatiter(self, L: List[Any], seen: Optional[Set[int]] = None) -> Any:
         for item in L:
             if type(item) is list:
+                # Keep track of the lists visited only if there is nesting.
+                if seen is None:
+                    seen = {id(L)}
+                if id(item) in seen:
+                    raise e.DataError("cannot dump a recursive list")
+                seen.add(id(item))
+
                 yield from self._flatiter(item, seen)
             elif item is not None:
                 yield item
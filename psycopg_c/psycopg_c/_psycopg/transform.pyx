@@ -433,13 +433,13 @@ cdef class Transformer:
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
-        cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
+        cdef pq.PGresult pgresult = self._pgresult  # avoid incref per item
+        cdef libpq.PGresult *res = pgresult._pgresult_ptr
         # cheeky access to the internal PGresult structure
         cdef pg_result_int *ires = <pg_result_int*>res
 
         cdef int row
         cdef int col
-        cdef PGresAttValue *attval
         cdef object record  # not 'tuple' as it would check on assignment
 
         cdef object records = PyList_New(row1 - row0)
@@ -454,35 +454,12 @@ cdef class Transformer:
 
         for col in range(self._nfields):
             loader = PyList_GET_ITEM(row_loaders, col)
-            if (<RowLoader>loader).cloader is not None:
-                for row in range(row0, row1):
-                    brecord = PyList_GET_ITEM(records, row - row0)
-                    attval = &(ires.tuples[row][col])
-                    if attval.len == -1:  # NULL_LEN
-                        pyval = None
-                    else:
-                        pyval = (<RowLoader>loader).cloader.cload(
-                            attval.value, attval.len)
-
-                    Py_INCREF(pyval)
-                    PyTuple_SET_ITEM(<object>brecord, col, pyval)
-
-            else:
-                for row in range(row0, row1):
-                    brecord = PyList_GET_ITEM(records, row - row0)
-                    attval = &(ires.tuples[row][col])
-                    if attval.len == -1:  # NULL_LEN
-                        pyval = None
-                    else:
-                        b = PyMemoryView_FromObject(
-                            ViewBuffer._from_buffer(
-                                self._pgresult,
-                                <unsigned char *>attval.value, attval.len))
-                        pyval = PyObject_CallFunctionObjArgs(
-                            (<RowLoader>loader).loadfunc, <PyObject *>b, NULL)
-
-                    Py_INCREF(pyval)
-                    PyTuple_SET_ITEM(<object>brecord, col, pyval)
+            for row in range(row0, row1):
+                brecord = PyList_GET_ITEM(records, row - row0)
+                pyval = _load_value(
+                    pgresult, &(ires.tuples[row][col]), <RowLoader>loader)
+                Py_INCREF(pyval)
+                PyTuple_SET_ITEM(<object>brecord, col, pyval)
 
         if make_row is not tuple:
             for i in range(row1 - row0):
@@ -501,35 +478,22 @@ cdef class Transformer:
         if not 0 <= row < self._ntuples:
             return None
 
-        cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
+        cdef pq.PGresult pgresult = self._pgresult  # avoid incref per item
+        cdef libpq.PGresult *res = pgresult._pgresult_ptr
         # cheeky access to the internal PGresult structure
         cdef pg_result_int *ires = <pg_result_int*>res
 
         cdef PyObject *loader  # borrowed RowLoader
         cdef int col
-        cdef PGresAttValue *attval
         cdef object record  # not 'tuple' as it would check on assignment
 
         record = PyTuple_New(self._nfields)
         row_loaders = self._row_loaders  # avoid an incref/decref per item
 
         for col in range(self._nfields):
-            attval = &(ires.tuples[row][col])
-            if attval.len == -1:  # NULL_LEN
-                pyval = None
-            else:
-                loader = PyList_GET_ITEM(row_loaders, col)
-                if (<RowLoader>loader).cloader is not None:
-                    pyval = (<RowLoader>loader).cloader.cload(
-                        attval.value, attval.len)
-                else:
-                    b = PyMemoryView_FromObject(
-                        ViewBuffer._from_buffer(
-                            self._pgresult,
-                            <unsigned char *>attval.value, attval.len))
-                    pyval = PyObject_CallFunctionObjArgs(
-                        (<RowLoader>loader).loadfunc, <PyObject *>b, NULL)
-
+            loader = PyList_GET_ITEM(row_loaders, col)
+            pyval = _load_value(
+                pgresult, &(ires.tuples[row][col]), <RowLoader>loader)
             Py_INCREF(pyval)
             PyTuple_SET_ITEM(record, col, pyval)
 
@@ -619,6 +583,24 @@ cdef class Transformer:
         return <PyObject *>row_loader
 
 
+cdef inline object _load_value(
+    pq.PGresult pgresult, PGresAttValue *attval, RowLoader loader
+):
+    """
+    Return the Python object loaded from a result value, None if NULL.
+    """
+    if attval.len == -1:  # NULL_LEN
+        return None
+
+    if loader.cloader is not None:
+        return loader.cloader.cload(attval.value, attval.len)
+
+    b = PyMemoryView_FromObject(
+        ViewBuffer._from_buffer(
+            pgresult, <unsigned char *>attval.value, attval.len))
+    return PyObject_CallFunctionObjArgs(loader.loadfunc, <PyObject *>b, NULL)
+
+
 cdef object _as_row_dumper(object dumper):
     cdef RowDumper row_dumper = RowDumper()
 
@@ -43,6 +43,7 @@ def crdb_adapters():
     """Restore the crdb adapters after a test has changed them."""
     dumpers = deepcopy(adapters._dumpers)
     dumpers_by_oid = deepcopy(adapters._dumpers_by_oid)
+    dumpers_found = deepcopy(adapters._dumpers_found)
     loaders = deepcopy(adapters._loaders)
     types = list(adapters.types)
 
@@ -50,6 +51,7 @@ def crdb_adapters():
 
     adapters._dumpers = dumpers
     adapters._dumpers_by_oid = dumpers_by_oid
+    adapters._dumpers_found = dumpers_found
     adapters._loaders = loaders
     adapters.types.clear()
     for t in types:
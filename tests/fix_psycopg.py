@@ -10,6 +10,7 @@ def global_adapters():
 
     dumpers = deepcopy(adapters._dumpers)
     dumpers_by_oid = deepcopy(adapters._dumpers_by_oid)
+    dumpers_found = deepcopy(adapters._dumpers_found)
     loaders = deepcopy(adapters._loaders)
     types = list(adapters.types)
 
@@ -17,6 +18,7 @@ def global_adapters():
 
     adapters._dumpers = dumpers
     adapters._dumpers_by_oid = dumpers_by_oid
+    adapters._dumpers_found = dumpers_found
     adapters._loaders = loaders
     adapters.types.clear()
     for t in types:
@@ -166,6 +166,12 @@ def test_get_value(pgconn):
     assert res.get_value(0, 0) is None
 
 
+def test_get_value_binary_zeros(pgconn):
+    res = pgconn.exec_params(b"select '\\x00ff0000'::bytea", [], result_format=1)
+    assert res.status == pq.ExecStatus.TUPLES_OK, res.error_message
+    assert res.get_value(0, 0) == b"\x00\xff\x00\x00"
+
+
 def test_nparams_types(pgconn):
     res = pgconn.prepare(b"", b"select $1::int4, $2::text")
     assert res.status == pq.ExecStatus.COMMAND_OK, res.error_message
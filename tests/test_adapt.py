@@ -7,7 +7,8 @@ import pytest
 import psycopg
 from psycopg import pq, sql, postgres
 from psycopg import errors as e
-from psycopg.adapt import Transformer, PyFormat, Dumper, Loader
+from psycopg.abc import LoadFunc
+from psycopg.adapt import Transformer, PyFormat, Dumper, Loader, AdaptersMap
 from psycopg._cmodule import _psycopg
 from psycopg.postgres import types as builtins
 from psycopg.types.array import ListDumper, ListBinaryDumper
@@ -47,6 +48,36 @@ def test_quote(data, result):
     assert dumper.quote(data) == result
 
 
+def test_transformer_no_dict():
+    t = Transformer()
+    with pytest.raises(AttributeError):
+        t.__dict__
+
+
+@pytest.mark.parametrize("nfields", [0, 1, 2, 10])
+def test_make_load_row(nfields):
+    from psycopg._py_transformer import _make_load_row
+
+    data = [
+        [None if (row + col) % 3 == 1 else b"%d" % col for col in range(nfields)]
+        for row in range(2)
+    ]
+
+    def col_loader(col: int) -> LoadFunc:
+        return lambda b: (col, bytes(b))
+
+    loaders = [col_loader(col) for col in range(nfields)]
+    load_row = _make_load_row(nfields)
+    assert _make_load_row(nfields) is load_row
+
+    for row in range(2):
+        rv = load_row(lambda r, c: data[r][c], row, loaders)
+        assert type(rv) is tuple
+        assert rv == tuple(
+            (None if val is None else (col, val)) for col, val in enumerate(data[row])
+        )
+
+
 def test_register_dumper_by_class(conn):
     dumper = make_dumper("x")
     assert conn.adapters.get_dumper(MyStr, PyFormat.TEXT) is not dumper
@@ -257,6 +288,47 @@ def test_cow_dumpers(conn):
     assert r == ("helloc2",)
 
 
+def test_cow_dumpers_subclass(conn):
+    cur1 = conn.cursor()
+    assert cur1.adapters.get_dumper(MyStr, PyFormat.TEXT) is (
+        conn.adapters.get_dumper(str, PyFormat.TEXT)
+    )
+
+    dumper = make_dumper("t")
+    conn.adapters.register_dumper(str, dumper)
+    assert conn.adapters.get_dumper(MyStr, PyFormat.TEXT) is dumper
+    assert cur1.adapters.get_dumper(MyStr, PyFormat.TEXT) is not dumper
+
+    cur2 = conn.cursor()
+    assert cur2.adapters.get_dumper(MyStr, PyFormat.TEXT) is dumper
+    dumper2 = make_dumper("c2")
+    cur2.adapters.register_dumper(str, dumper2)
+    assert cur2.adapters.get_dumper(MyStr, PyFormat.TEXT) is dumper2
+    assert conn.adapters.get_dumper(MyStr, PyFormat.TEXT) is dumper
+
+
+def test_dumpers_found_bounded(conn, monkeypatch):
+    adapters = AdaptersMap(conn.adapters)
+    monkeypatch.setattr(adapters, "_dumpers_found_maxsize", 10)
+    dumper = conn.adapters.get_dumper(str, PyFormat.TEXT)
+    for i in range(25):
+        cls = type(f"MyStr{i}", (str,), {})
+        assert adapters.get_dumper(cls, PyFormat.TEXT) is dumper
+        assert len(adapters._dumpers_found[PyFormat.TEXT]) <= 10
+
+
+def test_register_dumper_after_lookup(conn):
+    adapters = AdaptersMap(conn.adapters)
+    assert adapters.get_dumper(str, PyFormat.TEXT) is (
+        conn.adapters.get_dumper(str, PyFormat.TEXT)
+    )
+    dumper = make_dumper("t")
+    adapters.register_dumper(str, dumper)
+    assert adapters.get_dumper(str, PyFormat.TEXT) is dumper
+    assert adapters.get_dumper(str, PyFormat.AUTO) is dumper
+    assert conn.adapters.get_dumper(str, PyFormat.TEXT) is not dumper
+
+
 def test_cow_loaders(conn):
     conn.adapters.register_loader("text", make_loader("t"))
 
@@ -188,6 +188,14 @@ def test_executemany_type_change(conn):
     assert cur.fetchall() == [(1,), (100_000,)]
 
 
+def test_execute_result_type_change(conn):
+    sql = "select %s"
+    cur = conn.cursor()
+    assert cur.execute(sql, (1,)).fetchone() == (1,)
+    assert cur.execute(sql, ("hello",)).fetchone() == ("hello",)
+    assert cur.execute(sql, (2,)).fetchone() == (2,)
+
+
 @pytest.mark.parametrize(
     "query", ["copy testcopy from stdin", "copy testcopy to stdout"]
 )
@@ -189,6 +189,17 @@ async def test_executemany_type_change(aconn):
     assert (await cur.fetchall()) == [(1,), (100_000,)]
 
 
+async def test_execute_result_type_change(aconn):
+    sql = "select %s"
+    cur = aconn.cursor()
+    await cur.execute(sql, (1,))
+    assert await cur.fetchone() == (1,)
+    await cur.execute(sql, ("hello",))
+    assert await cur.fetchone() == ("hello",)
+    await cur.execute(sql, (2,))
+    assert await cur.fetchone() == (2,)
+
+
 @pytest.mark.parametrize(
     "query", ["copy testcopy from stdin", "copy testcopy to stdout"]
 )
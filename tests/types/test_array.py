@@ -113,6 +113,18 @@ def test_bad_binary_array(input):
         tx.get_dumper(input, PyFormat.BINARY).dump(input)
 
 
+@pytest.mark.parametrize("fmt_in", PyFormat)
+def test_dump_recursive_list(fmt_in):
+    tx = Transformer()
+    L1: List[Any] = [10, 20]
+    L1.append(L1)
+    L2: List[Any] = [[10], [20]]
+    L2[1].append(L2)
+    for obj in (L1, L2):
+        with pytest.raises(psycopg.DataError, match="recursive"):
+            tx.get_dumper(obj, fmt_in)
+
+
 @pytest.mark.crdb_skip("nested array")
 @pytest.mark.parametrize("fmt_out", pq.Format)
 @pytest.mark.parametrize("want, obj", tests_int)